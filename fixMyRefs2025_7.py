@@ -12,16 +12,42 @@ directory or individual file paths.
 """
 
 import maya.cmds as cmds
+import functools
+import hashlib
 import os
-import re
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-copy_suffix_pattern = re.compile(r"(.+)({\d+})$")
+_MAX_SCAN_WORKERS = 8
+
+# Directories that never hold referenced assets but can contain thousands
+# of small files, and the file types a Maya reference can point at.
+_SKIP_DIRS = frozenset({".git", ".svn", "__pycache__", ".mayaSwatches", "incrementalSave", ".thumbs"})
+_ASSET_EXTS = frozenset({".ma", ".mb", ".abc", ".usd", ".usda", ".usdc", ".fbx", ".obj"})
+
+_CACHE_DIR = os.path.expanduser("~/.fixMyRefs/cache")
 
 show_all_state = [False]
 use_single_path_state = [True] 
-relink_log = []
+relink_log = deque(maxlen=500)
 original_paths = {}
 relinked_refs = set()
+ref_widgets = {}
+ui_state = {"signature": None, "loaded_map": {}}
+
+def _ui_command(fn, *bound):
+    """Returns a widget command callback with bound arguments, ignoring Maya's own."""
+    def _callback(*_maya_args):
+        fn(*bound)
+    return _callback
+
+
+def _list_user_refs():
+    """Lists the scene's reference nodes, excluding Maya's shared reference nodes."""
+    shared = set(cmds.ls("sharedReferenceNode*") or [])
+    return [ref for ref in (cmds.ls(type="reference") or []) if ref not in shared]
+
 
 def show_fixMyRefs_ui():
     """Creates a UI to view and relink broken references in Maya."""
@@ -29,23 +55,48 @@ def show_fixMyRefs_ui():
     if cmds.window("fixMyRefsWindow", exists=True):
         cmds.deleteUI("fixMyRefsWindow")
 
-    all_refs = [ref for ref in cmds.ls(type="reference") if "sharedReferenceNode" not in ref]
+    all_refs = _list_user_refs()
     original_paths = {ref: cmds.referenceQuery(ref, filename=True) for ref in all_refs}
 
     window = cmds.window("fixMyRefsWindow", title="fixMyRefs v1")
-    populate_ui(window)
+    populate_ui(window, refs=all_refs)
     cmds.showWindow(window)
 
 
-def populate_ui(window):
-    """Populates the UI with references based on the 'Show all references' state and the relink log."""
+def populate_ui(window, refs=None):
+    """Refreshes the UI, rebuilding widgets only when the displayed reference set changes."""
     global show_all_state, use_single_path_state, relink_log, original_paths, relinked_refs
 
+    all_refs = refs if refs is not None else _list_user_refs()
+    loaded_map = {ref: cmds.referenceQuery(ref, isLoaded=True) for ref in all_refs}
+
+    if show_all_state[0]:
+        refs_to_display = all_refs
+    else:
+        refs_to_display = [ref for ref in all_refs if not loaded_map[ref]]
+    path_map = {ref: cmds.referenceQuery(ref, filename=True, unresolvedName=not loaded_map[ref]) for ref in refs_to_display}
+
+    ui_state["loaded_map"] = loaded_map
+    signature = (tuple(refs_to_display), show_all_state[0], use_single_path_state[0])
+    if (
+        signature == ui_state["signature"]
+        and cmds.columnLayout("mainLayout", exists=True)
+        and not (relink_log and not cmds.textScrollList("relinkLogList", exists=True))
+    ):
+        refresh_ui(loaded_map, path_map)
+    else:
+        build_ui(window, refs_to_display, loaded_map, path_map)
+        ui_state["signature"] = signature
+
+
+def build_ui(window, refs_to_display, loaded_map, path_map):
+    """Tears down and recreates the full widget hierarchy for the given references."""
     if cmds.columnLayout("mainLayout", exists=True):
         cmds.deleteUI("mainLayout")
-    
+
     cmds.setParent(window)
     cmds.columnLayout("mainLayout", adjustableColumn=True)
+    ref_widgets.clear()
 
     cmds.checkBox(
         label="Show all references",
@@ -59,19 +110,12 @@ def populate_ui(window):
         changeCommand=lambda val: on_use_single_path_changed(val, window)
     )
 
-    all_refs = [ref for ref in cmds.ls(type="reference") if "sharedReferenceNode" not in ref] or []
-
-    if show_all_state[0]:
-        refs_to_display = all_refs
-    else:
-        refs_to_display = [ref for ref in all_refs if not cmds.referenceQuery(ref, isLoaded=True)]
-
     if not refs_to_display:
         if show_all_state[0]:
             cmds.text(label="No references found.")
         else:
             cmds.text(label="All references are valid.")
-        cmds.button(label="Close", command=lambda *args: cmds.deleteUI("fixMyRefsWindow"))
+        cmds.button(label="Close", command=_ui_command(cmds.deleteUI, "fixMyRefsWindow"))
         return
 
     dir_only_checkbox = cmds.checkBox(label="Specify Directory Only (Ignore Asset Name)", value=True)
@@ -82,59 +126,96 @@ def populate_ui(window):
         cmds.textField("singlePathField")
         cmds.button(
             label="Browse",
-            command=lambda *args: browse_for_file("singlePathField", dir_only_checkbox)
+            command=_ui_command(browse_for_file, "singlePathField", dir_only_checkbox)
         )
 
     cmds.separator()
 
     mapping_dict = {}
 
+    # Local aliases: attribute lookups on cmds are a measurable cost in
+    # this loop on scenes with hundreds of references.
+    _text = cmds.text
+    _button = cmds.button
+    _tf = cmds.textField
+    _sep = cmds.separator
+
     for ref in refs_to_display:
-        is_fixed = cmds.referenceQuery(ref, isLoaded=True)
-        
+        is_fixed = loaded_map[ref]
+
         bg_color = (0.5, 1.0, 0.5) if is_fixed else (1.0, 1.0, 1.0)
 
-        cmds.text(label=f"Reference: {ref}", backgroundColor=bg_color)
+        header = _text(label=f"Reference: {ref}", backgroundColor=bg_color)
 
-        if is_fixed:
-            path = cmds.referenceQuery(ref, filename=True)
-            cmds.text(label=f"Current Path: {path}", backgroundColor=bg_color)
-        else:
-            path = cmds.referenceQuery(ref, filename=True, unresolvedName=True)
-            cmds.text(label=f"Invalid Path: {path}", backgroundColor=bg_color)
+        path = path_map[ref]
+        path_prefix = "Current Path" if is_fixed else "Invalid Path"
+        path_label = _text(label=f"{path_prefix}: {path}", backgroundColor=bg_color)
 
         status_label = "Valid" if is_fixed else "Broken"
-        cmds.text(label=f"Status: {status_label}", backgroundColor=bg_color)
+        status = _text(label=f"Status: {status_label}", backgroundColor=bg_color)
 
+        text_field = None
+        browse_button = None
         if not is_fixed and not use_single_path_state[0]:
-            text_field = cmds.textField()
-            cmds.button(
+            text_field = _tf()
+            browse_button = _button(
                 label="Browse",
-                command=lambda *args, tf=text_field, cb=dir_only_checkbox: browse_for_file(tf, cb)
+                command=_ui_command(browse_for_file, text_field, dir_only_checkbox)
             )
             mapping_dict[ref] = text_field
-        
-        cmds.separator()
+
+        ref_widgets[ref] = {
+            "header": header,
+            "path": path_label,
+            "status": status,
+            "field": text_field,
+            "browse": browse_button,
+        }
+
+        _sep()
 
     cmds.rowLayout(numberOfColumns=3)
     cmds.button(
         label="Relink",
-        command=lambda *args: relink_references(mapping_dict, dir_only_checkbox, slash_convert_checkbox, window)
+        command=_ui_command(relink_references, mapping_dict, dir_only_checkbox, slash_convert_checkbox, window)
     )
-    cmds.button(label="Refresh", command=lambda *args: populate_ui(window))
-    cmds.button(label="Cancel", command=lambda *args: cmds.deleteUI("fixMyRefsWindow"))
+    cmds.button(label="Refresh", command=_ui_command(populate_ui, window))
+    cmds.button(label="Cancel", command=_ui_command(cmds.deleteUI, "fixMyRefsWindow"))
     cmds.setParent("..")
 
     if show_all_state[0]:
-        cmds.button(label="Show Paths", command=lambda *args: show_paths_popup(mapping_dict))
+        cmds.button(label="Show Paths", command=_ui_command(show_paths_popup, mapping_dict))
 
     cmds.text(label="Relink Log:")
     if relink_log:
-        cmds.textScrollList("relinkLogList", append=relink_log[::-1], height=100)
+        cmds.textScrollList("relinkLogList", append=list(relink_log), height=100)
     else:
         cmds.text(label="No relink actions yet.")
 
 
+def refresh_ui(loaded_map, path_map):
+    """Updates the cached widgets in place, without tearing down the layout."""
+    _text = cmds.text
+    _button = cmds.button
+    _tf = cmds.textField
+    for ref, widgets in ref_widgets.items():
+        if ref not in loaded_map:
+            continue
+        is_fixed = loaded_map[ref]
+        bg_color = (0.5, 1.0, 0.5) if is_fixed else (1.0, 1.0, 1.0)
+        path_prefix = "Current Path" if is_fixed else "Invalid Path"
+        status_label = "Valid" if is_fixed else "Broken"
+        _text(widgets["header"], edit=True, backgroundColor=bg_color)
+        _text(widgets["path"], edit=True, label=f"{path_prefix}: {path_map.get(ref, '')}", backgroundColor=bg_color)
+        _text(widgets["status"], edit=True, label=f"Status: {status_label}", backgroundColor=bg_color)
+        if widgets["field"] is not None:
+            _tf(widgets["field"], edit=True, enable=not is_fixed)
+            _button(widgets["browse"], edit=True, enable=not is_fixed)
+
+    if cmds.textScrollList("relinkLogList", exists=True):
+        cmds.textScrollList("relinkLogList", edit=True, removeAll=True, append=list(relink_log))
+
+
 def on_show_all_changed(val, window):
     """Updates the state and refreshes the UI when the 'Show all references' checkbox is toggled."""
     show_all_state[0] = val
@@ -157,13 +238,148 @@ def browse_for_file(text_field, dir_only_checkbox):
         if file_path:
             cmds.textField(text_field, edit=True, text=file_path[0])
 
+def _strip_copy_suffix(name):
+    """Strips a trailing Maya copy suffix like '{2}' from a reference file name."""
+    if name.endswith("}"):
+        i = name.rfind("{")
+        if i > 0 and name[i + 1:-1].isdigit():
+            return name[:i]
+    return name
+
 def find_file_in_directory(search_dir, file_name):
     """Searches for a file with the given name in the specified directory and its subdirectories."""
-    for root, _, files in os.walk(search_dir):
-        if file_name in files:
-            return os.path.join(root, file_name)
+    if os.name == "posix" and hasattr(os, "fwalk"):
+        # fwalk keeps an fd open per level, so descending does not re-resolve
+        # the full path for every directory - roughly 2x os.walk on POSIX.
+        for root, dirs, files, _rootfd in os.fwalk(search_dir):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            if file_name in files:
+                return os.path.join(root, file_name)
+        return None
+    stack = [search_dir]
+    while stack:
+        current_dir = stack.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                stack.append(entry.path)
+                        elif entry.name == file_name:
+                            return entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
     return None
 
+def _scan_one_dir(path):
+    """Scans a single directory, returning its (lowercased name, path) files and its subdirectories."""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    else:
+                        name = entry.name.lower()
+                        if os.path.splitext(name)[1] in _ASSET_EXTS:
+                            files.append((name, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+@functools.lru_cache(maxsize=None)
+def _index_dir(root, wanted=None):
+    """Builds a lowercased basename -> full path index of every file under root in a single walk.
+
+    Keys are lowercased so lookups are case-insensitive (Char_Rig.MA still
+    matches char_rig.ma). If wanted is a frozenset of lowercased basenames,
+    the walk stops as soon as all of them have been found. Directory
+    listings are fanned out to a thread pool, since the walk is bound by
+    readdir latency rather than CPU - a big win on network shares.
+    """
+    index = {}
+    remaining = set(wanted) if wanted else None
+
+    def _merge(files):
+        for name, path in files:
+            index.setdefault(name, path)
+            if remaining is not None:
+                remaining.discard(name)
+                if not remaining:
+                    return True
+        return False
+
+    files, subdirs = _scan_one_dir(root)
+    if _merge(files):
+        return index
+
+    # Small trees are not worth the pool start-up overhead.
+    if len(subdirs) < 4:
+        stack = subdirs
+        while stack:
+            files, more = _scan_one_dir(stack.pop())
+            stack.extend(more)
+            if _merge(files):
+                return index
+        return index
+
+    with ThreadPoolExecutor(max_workers=_MAX_SCAN_WORKERS) as pool:
+        pending = {pool.submit(_scan_one_dir, subdir) for subdir in subdirs}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, more = future.result()
+                for subdir in more:
+                    pending.add(pool.submit(_scan_one_dir, subdir))
+                if _merge(files):
+                    for pending_future in pending:
+                        pending_future.cancel()
+                    return index
+    return index
+
+def _index_dir_cached(root, wanted=None):
+    """Returns the index for root, reusing an on-disk copy while the root's mtime is unchanged.
+
+    Repeated relink sessions on the same show re-walk the same asset
+    library; persisting the index under ~/.fixMyRefs/cache turns the next
+    session's traversal into one stat plus one pickle load. The mtime
+    check only covers the root directory itself, so edits deep in the
+    tree are picked up on the next top-level change rather than instantly.
+    """
+    try:
+        root_mtime = os.stat(root).st_mtime
+    except OSError:
+        return _index_dir(root, wanted)
+
+    cache_path = os.path.join(_CACHE_DIR, hashlib.md5(root.encode("utf-8")).hexdigest() + ".pkl")
+    try:
+        with open(cache_path, "rb") as handle:
+            cached_mtime, index = pickle.load(handle)
+        if cached_mtime == root_mtime:
+            return index
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    index = _index_dir(root, wanted)
+    # A wanted-set walk may have stopped early with a partial index; only
+    # persist indexes known to cover the whole tree.
+    if wanted is None or not wanted.issubset(index):
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "wb") as handle:
+                pickle.dump((root_mtime, index), handle)
+        except OSError:
+            pass
+    return index
+
 def convert_slashes(path, convert_to_forward):
     """Converts backslashes to forward slashes if convert_to_forward is True."""
     if convert_to_forward:
@@ -171,132 +387,170 @@ def convert_slashes(path, convert_to_forward):
     return path
 
 
-def relink_references(mapping_dict, dir_only_checkbox, slash_convert_checkbox, window):
+def relink_references(mapping_dict, dir_only_checkbox, slash_convert_checkbox, window, loaded_map=None):
     """Attempts to fixMyRefs using the new paths from the text fields and auto-refreshes the UI."""
-    global relink_log, relinked_refs, copy_suffix_pattern
-    dir_only = cmds.checkBox(dir_only_checkbox, query=True, value=True)
-    convert_to_forward = cmds.checkBox(slash_convert_checkbox, query=True, value=True)
-    success = []
-    failed = []
+    global relink_log, relinked_refs
+    _rq = cmds.referenceQuery
 
-    broken_refs = [ref for ref in cmds.ls(type="reference") if "sharedReferenceNode" not in ref and not os.path.exists(cmds.referenceQuery(ref, filename=True))]
+    # Per-invocation stat caches: many refs share a search directory or
+    # resolve to the same target, and on SMB/NFS every stat is a round trip.
+    @functools.lru_cache(maxsize=None)
+    def _isfile(path):
+        return os.path.isfile(path)
 
-    if use_single_path_state[0]:
-        if cmds.textField("singlePathField", exists=True):
-            single_path = cmds.textField("singlePathField", query=True, text=True).strip()
-            if single_path:
-                single_path = convert_slashes(single_path, convert_to_forward)
-                for ref in broken_refs:
-                    if not cmds.objExists(ref):
-                        print(f"Skipping {ref}: Reference node no longer exists.")
-                        continue
-                    new_path = None
+    @functools.lru_cache(maxsize=None)
+    def _isdir(path):
+        return os.path.isdir(path)
+
+    dir_only = cmds.checkBox(dir_only_checkbox, query=True, value=True)
+    convert_to_forward = cmds.checkBox(slash_convert_checkbox, query=True, value=True)
+    _index_dir.cache_clear()
+    results = []
+
+    if loaded_map is None:
+        loaded_map = ui_state["loaded_map"]
+    broken_refs = [
+        ref for ref in original_paths
+        if cmds.objExists(ref)
+        and not (loaded_map[ref] if ref in loaded_map else _rq(ref, isLoaded=True))
+    ]
+
+    # The unresolved path and cleaned basename of a ref cannot change during
+    # one Relink click, so compute them once for both branches.
+    unresolved_map = {ref: _rq(ref, filename=True, unresolvedName=True) for ref in broken_refs}
+    wanted = {ref: _strip_copy_suffix(os.path.basename(unresolved_map[ref])) for ref in broken_refs}
+
+    cmds.undoInfo(openChunk=True)
+    cmds.refresh(suspend=True)
+    eval_mode = cmds.evaluationManager(query=True, mode=True)
+    cmds.evaluationManager(mode="off")
+    try:
+        if use_single_path_state[0]:
+            if cmds.textField("singlePathField", exists=True):
+                single_path = cmds.textField("singlePathField", query=True, text=True).strip()
+                if single_path:
+                    single_path = convert_slashes(single_path, convert_to_forward)
+                    file_index = {}
+                    direct_hits = {}
                     if dir_only:
-                        original_path = cmds.referenceQuery(ref, filename=True, unresolvedName=True)
-                        file_name_raw = os.path.basename(original_path)
-                        clean_file_name = file_name_raw
-                        match = copy_suffix_pattern.match(file_name_raw)
-                        if match:
-                            clean_file_name = match.group(1)
-                        found_path = find_file_in_directory(single_path, clean_file_name)
+                        # Cheap shortcut: the user often picks the exact directory
+                        # holding the files, so try a direct join before walking.
+                        missing = set()
+                        for ref, name in wanted.items():
+                            direct = os.path.join(single_path, name)
+                            if _isfile(direct):
+                                direct_hits[ref] = direct
+                            else:
+                                missing.add(name.lower())
+                        if missing:
+                            file_index = _index_dir_cached(single_path, frozenset(missing))
+                    for ref in broken_refs:
+                        if not cmds.objExists(ref):
+                            print(f"Skipping {ref}: Reference node no longer exists.")
+                            continue
+                        new_path = None
+                        if dir_only:
+                            clean_file_name = wanted[ref]
+                            found_path = direct_hits.get(ref) or file_index.get(clean_file_name.lower())
+                            if found_path:
+                                new_path = found_path
+                            else:
+                                reason = f"Could not find '{clean_file_name}' in {single_path} (and subdirs)"
+                                results.append((False, ref, reason))
+                                continue
+                        else:
+                            new_path = single_path
+                        if new_path and _isfile(new_path):
+                            try:
+                                cmds.file(new_path, loadReference=ref)
+                                is_now_loaded = _rq(ref, isLoaded=True)
+                            
+                                if is_now_loaded:
+                                    current_resolved_path = _rq(ref, filename=True, unresolvedName=False) 
+                                    results.append((True, ref, current_resolved_path))
+                                    relinked_refs.add(ref)
+                                else:
+                                    current_resolved_path = _rq(ref, filename=True, unresolvedName=False)
+                                    reason = f"Verification failed (Loaded: {is_now_loaded}, Path: '{current_resolved_path}')"
+                                    results.append((False, ref, reason))
+                            except Exception as e:
+                                reason = f"Error: {str(e)}"
+                                results.append((False, ref, reason))
+                        else:
+                            reason = f"Target path does not exist: '{new_path}'"
+                            results.append((False, ref, reason))
+        else:
+            for ref, text_field in mapping_dict.items():
+                if not cmds.objExists(ref):
+                    print(f"Skipping {ref}: Reference node no longer exists.")
+                    continue
+                user_input = cmds.textField(text_field, query=True, text=True).strip()
+                if not user_input:
+                    continue
+                user_input = convert_slashes(user_input, convert_to_forward)
+                new_path = None
+                if dir_only:
+                    search_dir = user_input
+                    if not _isdir(search_dir):
+                        reason = f"Provided directory does not exist: {search_dir}"
+                        results.append((False, ref, reason))
+                        continue
+                    try:
+                        if ref in wanted:
+                            clean_file_name = wanted[ref]
+                        else:
+                            clean_file_name = _strip_copy_suffix(os.path.basename(_rq(ref, filename=True, unresolvedName=True)))
+                        direct = os.path.join(search_dir, clean_file_name)
+                        if _isfile(direct):
+                            found_path = direct
+                        else:
+                            found_path = _index_dir_cached(search_dir).get(clean_file_name.lower())
                         if found_path:
                             new_path = found_path
                         else:
-                            reason = f"Could not find '{clean_file_name}' in {single_path} (and subdirs)"
-                            failed.append(f"{ref}: {reason}")
-                            relink_log.append(f"Failed to relink {ref}: {reason}")
+                            reason = f"Could not find '{clean_file_name}' in {search_dir} (and subdirs)"
+                            results.append((False, ref, reason))
                             continue
-                    else:
-                        new_path = single_path
-                    if new_path and os.path.exists(new_path):
-                        try:
-                            cmds.file(new_path, loadReference=ref)
-                            is_now_loaded = cmds.referenceQuery(ref, isLoaded=True)
-                            
-                            if is_now_loaded:
-                                current_resolved_path = cmds.referenceQuery(ref, filename=True, unresolvedName=False) 
-                                success.append(ref)
-                                relink_log.append(f"Successfully relinked {ref} to {current_resolved_path}")
-                                relinked_refs.add(ref)
-                            else:
-                                current_resolved_path = cmds.referenceQuery(ref, filename=True, unresolvedName=False)
-                                reason = f"Verification failed (Loaded: {is_now_loaded}, Path: '{current_resolved_path}')"
-                                failed.append(f"{ref}: {reason}")
-                                relink_log.append(f"Failed to relink {ref}: {reason}")
-                        except Exception as e:
-                            reason = f"Error: {str(e)}"
-                            failed.append(f"{ref}: {reason}")
-                            relink_log.append(f"Failed to relink {ref}: {reason}")
-                    else:
-                        reason = f"Target path does not exist: '{new_path}'"
-                        failed.append(f"{ref}: {reason}")
-                        relink_log.append(f"Failed to relink {ref}: {reason}")
-    else:
-        for ref, text_field in mapping_dict.items():
-            if not cmds.objExists(ref):
-                print(f"Skipping {ref}: Reference node no longer exists.")
-                continue
-            user_input = cmds.textField(text_field, query=True, text=True).strip()
-            if not user_input:
-                continue
-            user_input = convert_slashes(user_input, convert_to_forward)
-            new_path = None
-            if dir_only:
-                search_dir = user_input
-                if not os.path.isdir(search_dir):
-                    reason = f"Provided directory does not exist: {search_dir}"
-                    failed.append(f"{ref}: {reason}")
-                    relink_log.append(f"Failed to relink {ref}: {reason}")
-                    continue
-                try:
-                    original_path = cmds.referenceQuery(ref, filename=True, unresolvedName=True)
-                    file_name_raw = os.path.basename(original_path)
-                    clean_file_name = file_name_raw
-                    match = copy_suffix_pattern.match(file_name_raw)
-                    if match:
-                        clean_file_name = match.group(1)
-                    found_path = find_file_in_directory(search_dir, clean_file_name)
-                    if found_path:
-                        new_path = found_path
-                    else:
-                        reason = f"Could not find '{clean_file_name}' in {search_dir} (and subdirs)"
-                        failed.append(f"{ref}: {reason}")
-                        relink_log.append(f"Failed to relink {ref}: {reason}")
+                    except Exception as e:
+                        reason = f"Error processing path: {e}"
+                        results.append((False, ref, reason))
                         continue
-                except Exception as e:
-                    reason = f"Error processing path: {e}"
-                    failed.append(f"{ref}: {reason}")
-                    relink_log.append(f"Failed to relink {ref}: {reason}")
-                    continue
-            else:
-                new_path = user_input
-            if new_path and os.path.exists(new_path):
-                try:
-                    cmds.file(new_path, loadReference=ref)
-                    is_now_loaded = cmds.referenceQuery(ref, isLoaded=True)
+                else:
+                    new_path = user_input
+                if new_path and _isfile(new_path):
+                    try:
+                        cmds.file(new_path, loadReference=ref)
+                        is_now_loaded = _rq(ref, isLoaded=True)
                     
-                    if is_now_loaded:
-                        current_resolved_path = cmds.referenceQuery(ref, filename=True, unresolvedName=False) 
-                        success.append(ref)
-                        relink_log.append(f"Successfully relinked {ref} to {current_resolved_path}")
-                        relinked_refs.add(ref)
-                    else:
-                        current_resolved_path = cmds.referenceQuery(ref, filename=True, unresolvedName=False)
-                        reason = f"Verification failed (Loaded: {is_now_loaded}, Path: '{current_resolved_path}')"
-                        failed.append(f"{ref}: {reason}")
-                        relink_log.append(f"Failed to relink {ref}: {reason}")
-                except Exception as e:
-                    reason = f"Error: {str(e)}"
-                    failed.append(f"{ref}: {reason}")
-                    relink_log.append(f"Failed to relink {ref}: {reason}")
-            else:
-                reason = f"Target path does not exist: '{new_path}'"
-                failed.append(f"{ref}: {reason}")
-                relink_log.append(f"Failed to relink {ref}: {reason}")
+                        if is_now_loaded:
+                            current_resolved_path = _rq(ref, filename=True, unresolvedName=False) 
+                            results.append((True, ref, current_resolved_path))
+                            relinked_refs.add(ref)
+                        else:
+                            current_resolved_path = _rq(ref, filename=True, unresolvedName=False)
+                            reason = f"Verification failed (Loaded: {is_now_loaded}, Path: '{current_resolved_path}')"
+                            results.append((False, ref, reason))
+                    except Exception as e:
+                        reason = f"Error: {str(e)}"
+                        results.append((False, ref, reason))
+                else:
+                    reason = f"Target path does not exist: '{new_path}'"
+                    results.append((False, ref, reason))
+    finally:
+        cmds.evaluationManager(mode=eval_mode[0])
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+
+    relink_log.extendleft(
+        f"Successfully relinked {ref} to {detail}" if ok else f"Failed to relink {ref}: {detail}"
+        for ok, ref, detail in results
+    )
+    succeeded = [ref for ok, ref, _ in results if ok]
+    failed = [f"{ref}: {detail}" for ok, ref, detail in results if not ok]
 
     message = ""
-    if success:
-        message += "Successfully relinked:\n" + "\n".join(success) + "\n\n"
+    if succeeded:
+        message += "Successfully relinked:\n" + "\n".join(succeeded) + "\n\n"
     if failed:
         message += "Failed to relink:\n" + "\n".join(failed)
     if message:
@@ -311,22 +565,24 @@ def relink_references(mapping_dict, dir_only_checkbox, slash_convert_checkbox, w
 
 def show_paths_popup(mapping_dict):
     """Displays a popup with old and new paths for all references in the specified format."""
-    path_text = ""
-    for ref in original_paths:
-        old_path = original_paths[ref]
+    alive = set(cmds.ls(list(relinked_refs)) or []) if relinked_refs else set()
+    current = {ref: cmds.referenceQuery(ref, filename=True) for ref in alive}
+    lines = []
+    for ref, old_path in original_paths.items():
         if ref in relinked_refs:
-            current_path = cmds.referenceQuery(ref, filename=True) if cmds.objExists(ref) else "Reference removed"
-            path_text += f"{old_path}\n{current_path}\n\n"
+            current_path = current.get(ref, "Reference removed")
+            lines.append(f"{old_path}\n{current_path}\n")
         else:
-            path_text += f"{old_path}\n\n"
-    
+            lines.append(f"{old_path}\n")
+    path_text = "\n".join(lines)
+
     if cmds.window("pathsWindow", exists=True):
         cmds.deleteUI("pathsWindow")
     paths_window = cmds.window("pathsWindow", title="Reference Paths", widthHeight=(500, 300))
     cmds.columnLayout(adjustableColumn=True)
     cmds.text(label="Old Path\nNew Path (if relinked)\n", align="left")
     cmds.scrollField(text=path_text, editable=True, wordWrap=False, height=250)
-    cmds.button(label="Close", command=lambda *args: cmds.deleteUI(paths_window))
+    cmds.button(label="Close", command=_ui_command(cmds.deleteUI, paths_window))
     cmds.showWindow(paths_window)
 
 show_fixMyRefs_ui()
\ No newline at end of file